@@ -1,161 +1,449 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
 import json
-import textwrap
+import sys
+import time
 from pathlib import Path
-from typing import Dict
-
-from agents import Agent, Runner, ItemHelpers
+from typing import TYPE_CHECKING, Callable, Dict
 
 from constants.agent_instructions import MANAGER_INSTRUCTIONS, INTERACTION_ELEMENTS_INSTRUCTIONS, \
     TRANSITIONS_INSTRUCTIONS, STATES_INSTRUCTIONS, VISUALIZATION_ELEMENTS_INSTRUCTIONS, \
     VISUALIZATION_ARRAYS_INSTRUCTIONS
-from model.output_type_FuncSpec import FunctionalSpecification
-from model.output_type_InteractionElements import InteractionElements
-from model.output_type_States import States
-from model.output_type_Transitions import Transitions
-from model.output_type_VisualizationElements import VisualizationElements
-from model.output_type_VisualizationArrays import VisualizationArrays
+
+if TYPE_CHECKING:
+    from agents import Agent
+    from model.output_type_FuncSpec import FunctionalSpecification
 
 BASE_MODEL = "gpt-5.1"
 OUTPUT_DIR = Path("generated_specs")
+CACHE_DIR = OUTPUT_DIR / ".cache"
+AGENT_CACHE_DIR = OUTPUT_DIR / ".agent_cache"
 
 USER_INPUT = (
     "generate a complete functional specification of a virtual prototype with two cubes: one is a slider and the other one is a rotatable."
 )
 
 
+@functools.lru_cache(maxsize=1)
+def _generator_specs() -> tuple:
+    """One spec per JSON generator: agent name, target file,
+    FunctionalSpecification field, instructions, output type, and
+    prompt-cache key. Built on first use so importing this module does not
+    pay for Pydantic schema compilation of the output models.
+    """
+    from model._common import json_schema_for
+    from model.output_type_FuncSpec import FunctionalSpecification
+    from model.output_type_InteractionElements import InteractionElements
+    from model.output_type_States import States
+    from model.output_type_Transitions import Transitions
+    from model.output_type_VisualizationElements import VisualizationElements
+    from model.output_type_VisualizationArrays import VisualizationArrays
+
+    # Warm the memoized schema cache once, here, for run_vivian_batch: the
+    # batch request builder is the only consumer of json_schema_for — the
+    # Agents SDK derives output-type schemas through its own path.
+    for output_type in (InteractionElements, Transitions, States,
+                        VisualizationElements, VisualizationArrays,
+                        FunctionalSpecification):
+        json_schema_for(output_type)
+
+    return (
+        ("interaction_elements_agent", "InteractionElements.json", "interaction_elements",
+         INTERACTION_ELEMENTS_INSTRUCTIONS, InteractionElements, "vivian-interaction-elements"),
+        ("transitions_agent", "Transitions.json", "transitions",
+         TRANSITIONS_INSTRUCTIONS, Transitions, "vivian-transitions"),
+        ("states_agent", "States.json", "states",
+         STATES_INSTRUCTIONS, States, "vivian-states"),
+        ("visualization_elements_agent", "VisualizationElements.json", "visualization_elements",
+         VISUALIZATION_ELEMENTS_INSTRUCTIONS, VisualizationElements, "vivian-visualization-elements"),
+        ("visualization_arrays_agent", "VisualizationArrays.json", "visualization_arrays",
+         VISUALIZATION_ARRAYS_INSTRUCTIONS, VisualizationArrays, "vivian-visualization-arrays"),
+    )
+
+
+class _EventLog:
+    """Buffered stdout writer for the stream-event loop.
+
+    print() locks, encodes, and flushes per line; over hundreds of events per
+    run that dominates the loop. This collects encoded lines and writes them
+    to sys.stdout.buffer in batches.
+    """
+
+    _FLUSH_EVERY = 16
+
+    def __init__(self) -> None:
+        self._pending: "list[bytes]" = []
+
+    def line(self, text: str) -> None:
+        self._pending.append(text.encode("utf-8", errors="replace"))
+        if len(self._pending) >= self._FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(b"\n".join(self._pending) + b"\n")
+            sys.stdout.buffer.flush()
+            self._pending.clear()
+
+
+_PROMPT_TEMPLATE = (
+    "Create a complete Vivian FunctionalSpecification for the Unity scene below.\n"
+    "\n"
+    "Scene description:\n"
+    "{description}\n"
+    "\n"
+    "Interaction objects (name -> interaction type):\n"
+    "{objects}"
+)
+
+
 def build_vivian_prompt(description: str, objects: Dict[str, str]) -> str:
     object_lines = "\n".join(f"- {name}: {typ}" for name, typ in objects.items()) or "(none provided)"
-    return textwrap.dedent(
-        f"""
-        Create a complete Vivian FunctionalSpecification for the Unity scene below.
+    return _PROMPT_TEMPLATE.format(
+        description=description or "(no description provided)",
+        objects=object_lines,
+    )
+
+
+def _agent_cache_path(agent_name: str, instructions: str, normalized_input: str) -> Path:
+    """Cache file for one sub-agent output, keyed by agent, instructions, and input."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(agent_name.encode("utf-8"))
+    digest.update(instructions.encode("utf-8"))
+    digest.update(normalized_input.encode("utf-8"))
+    return AGENT_CACHE_DIR / f"{digest.hexdigest()}.json"
 
-        Scene description:
-        {description or "(no description provided)"}
 
-        Interaction objects (name -> interaction type):
-        {object_lines}
-        """
-    ).strip()
+def _cache_settings(cache_key: str, parallel_tool_calls: "bool | None" = None) -> "ModelSettings":
+    """Model settings that route an agent's calls to one prompt-cache bucket.
+
+    The instruction blobs are large module-level constants, so every call of a
+    given agent sends a byte-identical prefix. A stable prompt_cache_key lets
+    the provider reuse the prefilled prefix across calls instead of
+    re-tokenizing it; dynamic context must stay in the user message.
+    """
+    from agents import ModelSettings
+
+    return ModelSettings(
+        parallel_tool_calls=parallel_tool_calls,
+        extra_body={"prompt_cache_key": cache_key},
+    )
 
 
 def build_manager_agent() -> Agent:
     """Create the Vivian manager agent with all sub-agents attached."""
-    interaction_elements_agent = Agent(
-        name="interaction_elements_agent",
-        model=BASE_MODEL,
-        instructions=INTERACTION_ELEMENTS_INSTRUCTIONS,
-        output_type=InteractionElements
-    )
-    transitions_agent = Agent(
-        name="transitions_agent",
-        model=BASE_MODEL,
-        instructions=TRANSITIONS_INSTRUCTIONS,
-        output_type=Transitions
-    )
-    states_agent = Agent(
-        name="states_agent",
-        model=BASE_MODEL,
-        instructions=STATES_INSTRUCTIONS,
-        output_type=States
-    )
-    visualization_elements_agent = Agent(
-        name="visualization_elements_agent",
-        model=BASE_MODEL,
-        instructions=VISUALIZATION_ELEMENTS_INSTRUCTIONS,
-        output_type=VisualizationElements
-    )
-    visualization_arrays_agent = Agent(
-        name="visualization_arrays_agent",
-        model=BASE_MODEL,
-        instructions=VISUALIZATION_ARRAYS_INSTRUCTIONS,
-        output_type=VisualizationArrays
-    )
+    from agents import Agent, Runner, function_tool
+
+    from model.output_type_FuncSpec import FunctionalSpecification
+
+    # The five generators only differ in name, instructions, output type, and
+    # cache key, so clone one base agent instead of constructing five from
+    # scratch.
+    base_agent = Agent(name="_generator_base", model=BASE_MODEL)
+
+    def _generator_tool(filename: str, field: str, agent: Agent):
+        # Tool names keep the stable *_JSON_generator convention (AGENTS.md)
+        # so the manager can still regenerate single files selectively.
+        async def _generate(scenario_plan: str) -> str:
+            # The manager may re-request a generator on an unchanged plan;
+            # outputs are cached on disk keyed by agent name, instructions,
+            # and normalized plan, so repeats skip the LLM call.
+            normalized_plan = " ".join(scenario_plan.split())
+            cache_path = _agent_cache_path(agent.name, agent.instructions or "", normalized_plan)
+            if cache_path.exists():
+                cached = cache_path.read_text(encoding="utf-8")
+                print(f"Cache hit: {agent.name} reused {len(cached)} cached chars")
+                return cached
+            result = await Runner.run(agent, scenario_plan)
+            output = result.final_output.model_dump_json()
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(output, encoding="utf-8")
+            return output
+
+        return function_tool(
+            _generate,
+            name_override=f"{field}_JSON_generator",
+            description_override=(
+                f"Generates the {filename} file based on the prototype "
+                "description and existing elements."
+            ),
+        )
+
+    tools = []
+    for name, filename, field, instructions, output_type, cache_key in _generator_specs():
+        agent = base_agent.clone(
+            name=name,
+            instructions=instructions,
+            model_settings=_cache_settings(cache_key),
+            output_type=output_type,
+        )
+        tools.append(_generator_tool(filename, field, agent))
 
     return Agent(
         name="manager_agent",
         model=BASE_MODEL,
         instructions=MANAGER_INSTRUCTIONS,
-        tools=[
-            interaction_elements_agent.as_tool(
-                tool_name="interaction_elements_JSON_generator",
-                tool_description="Generates the InteractionElements.json file based on the prototype description and existing elements."
-            ),
-            transitions_agent.as_tool(
-                tool_name="transitions_JSON_generator",
-                tool_description="Generates the Transitions.json file based on the prototype description and existing elements."
-            ),
-            states_agent.as_tool(
-                tool_name="states_JSON_generator",
-                tool_description="Generates the States.json file based on the prototype description and existing elements."
-            ),
-            visualization_elements_agent.as_tool(
-                tool_name="visualization_elements_JSON_generator",
-                tool_description="Generates the VisualizationElements.json file based on the prototype description and existing elements."
-            ),
-            visualization_arrays_agent.as_tool(
-                tool_name="visualization_arrays_JSON_generator",
-                tool_description="Generates the VisualizationArrays.json file based on the prototype description and existing elements."
-            )
-        ],
+        # parallel_tool_calls lets the model request all five generators in a
+        # single turn, and the runner executes same-turn tool calls
+        # concurrently — the independent files still fan out in parallel.
+        model_settings=_cache_settings("vivian-manager", parallel_tool_calls=True),
+        tools=tools,
         output_type=FunctionalSpecification
     )
 
 
-async def run_vivian(user_input: str, output_dir: Path | None = OUTPUT_DIR) -> FunctionalSpecification | None:
-    """Run the Vivian agent pipeline and optionally persist outputs."""
-    manager_agent = build_manager_agent()
-    result = Runner.run_streamed(manager_agent, input=user_input)
-    tool_names_by_call_id = {}
-    async for event in result.stream_events():
-        if event.type == "raw_response_event":
-            continue
-        elif event.type == "agent_updated_stream_event":
-            print(f"Agent updated: {event.new_agent.name}")
-            continue
-        elif event.type == "run_item_stream_event":
-            if event.item.type == "tool_call_item":
-                raw = getattr(event.item, "raw_item", None)
-                call_id = None
-                if hasattr(raw, "name"):
-                    tool_name = raw.name
-                elif hasattr(raw, "function") and hasattr(raw.function, "name"):
-                    tool_name = raw.function.name
-                elif isinstance(raw, dict):
-                    tool_name = raw.get("name") or raw.get("function", {}).get("name")
-                    call_id = raw.get("call_id")
-                else:
-                    tool_name = None
-                if call_id is None and hasattr(raw, "call_id"):
-                    call_id = raw.call_id
-                if call_id and tool_name:
-                    tool_names_by_call_id[call_id] = tool_name
-                suffix = f": {tool_name}" if tool_name else ""
-                print(f"-- Tool was called{suffix}")
-            elif event.item.type == "tool_call_output_item":
+_INTERESTING_EVENT_TYPES = ("agent_updated_stream_event", "run_item_stream_event")
+
+
+async def _interesting_events(stream):
+    """Yield only the event types the consumer displays.
+
+    Raw response deltas arrive once per token and were previously iterated
+    just to be skipped; dropping them here keeps that branch out of the
+    consumer's hot loop.
+    """
+    interesting = _INTERESTING_EVENT_TYPES
+    async for event in stream:
+        if event.type in interesting:
+            yield event
+
+
+_RAW_EXTRACTORS: Dict[type, Callable[[object], "tuple[str | None, str | None]"]] = {}
+
+
+def _build_raw_extractor(raw: object) -> Callable[[object], "tuple[str | None, str | None]"]:
+    """Pick the (tool_name, call_id) access pattern for this raw item shape."""
+    if isinstance(raw, dict):
+        def extract(r):
+            return r.get("name") or r.get("function", {}).get("name"), r.get("call_id")
+    elif hasattr(raw, "name"):
+        def extract(r):
+            return r.name, getattr(r, "call_id", None)
+    elif hasattr(raw, "function") and hasattr(raw.function, "name"):
+        def extract(r):
+            return r.function.name, getattr(r, "call_id", None)
+    else:
+        def extract(r):
+            return None, getattr(r, "call_id", None)
+    return extract
+
+
+def _extract_tool_call(raw: object) -> "tuple[str | None, str | None]":
+    """Extract (tool_name, call_id) from a raw tool-call item.
+
+    The shape of the raw item only depends on its type, so the probing runs
+    once per type and every later event of that type is a single dict lookup.
+    """
+    extractor = _RAW_EXTRACTORS.get(type(raw))
+    if extractor is None:
+        extractor = _RAW_EXTRACTORS[type(raw)] = _build_raw_extractor(raw)
+    return extractor(raw)
+
+
+@functools.lru_cache(maxsize=1)
+def get_manager_agent() -> Agent:
+    """Return the shared manager agent, building it on first use.
+
+    Agents are stateless across runs (the input goes to the Runner), so one
+    instance can serve every call without re-running Pydantic schema
+    generation for the output types.
+    """
+    return build_manager_agent()
+
+
+@functools.lru_cache(maxsize=1)
+def _instructions_hash() -> str:
+    """Hash of every instruction blob that shapes a run; part of the cache key."""
+    digest = hashlib.blake2b(digest_size=16)
+    for text in (
+        MANAGER_INSTRUCTIONS,
+        INTERACTION_ELEMENTS_INSTRUCTIONS,
+        TRANSITIONS_INSTRUCTIONS,
+        STATES_INSTRUCTIONS,
+        VISUALIZATION_ELEMENTS_INSTRUCTIONS,
+        VISUALIZATION_ARRAYS_INSTRUCTIONS,
+    ):
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _run_cache_path(user_input: str) -> Path:
+    """Cache file for a run, keyed by normalized input, model, and instructions."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(" ".join(user_input.split()).lower().encode("utf-8"))
+    digest.update(BASE_MODEL.encode("utf-8"))
+    digest.update(_instructions_hash().encode("ascii"))
+    return CACHE_DIR / f"{digest.hexdigest()}.json"
+
+
+async def run_vivian(
+    user_input: str,
+    output_dir: Path | None = OUTPUT_DIR,
+    use_cache: bool = True,
+) -> FunctionalSpecification | None:
+    """Run the Vivian agent pipeline and optionally persist outputs.
+
+    Identical requests (same input, model, and instructions) are served from
+    an on-disk cache instead of re-running the whole agent pipeline.
+    """
+    from agents import ItemHelpers, Runner
+
+    from model.output_type_FuncSpec import FunctionalSpecification
+
+    cache_path = _run_cache_path(user_input)
+    final_output = None
+    if use_cache and cache_path.exists():
+        print(f"Cache hit: loading specification from {cache_path}")
+        final_output = FunctionalSpecification.model_validate_json(
+            cache_path.read_text(encoding="utf-8")
+        )
+
+    if final_output is None:
+        manager_agent = get_manager_agent()
+        result = Runner.run_streamed(manager_agent, input=user_input)
+        tool_names_by_call_id = {}
+        log = _EventLog()
+        async for event in _interesting_events(result.stream_events()):
+            if event.type == "agent_updated_stream_event":
+                log.line(f"Agent updated: {event.new_agent.name}")
                 continue
-            elif event.item.type == "message_output_item":
-                print(f"-- Message output:\n {ItemHelpers.text_message_output(event.item)}")
-            else:
-                pass
+            elif event.type == "run_item_stream_event":
+                if event.item.type == "tool_call_item":
+                    raw = getattr(event.item, "raw_item", None)
+                    tool_name, call_id = _extract_tool_call(raw)
+                    if call_id and tool_name:
+                        tool_names_by_call_id[call_id] = tool_name
+                    suffix = f": {tool_name}" if tool_name else ""
+                    log.line(f"-- Tool was called{suffix}")
+                elif event.item.type == "tool_call_output_item":
+                    # Pop the pending entry so the mapping never outgrows the
+                    # set of in-flight tool calls; the payload itself is not
+                    # echoed (it is persisted to disk below).
+                    _, call_id = _extract_tool_call(getattr(event.item, "raw_item", None))
+                    tool_names_by_call_id.pop(call_id, None)
+                    continue
+                elif event.item.type == "message_output_item":
+                    log.line(f"-- Message output:\n {ItemHelpers.text_message_output(event.item)}")
+                else:
+                    pass
+        log.flush()
 
-    final_output = getattr(result, "final_output", None)
+        final_output = getattr(result, "final_output", None)
+        if final_output and use_cache:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(final_output.model_dump_json(), encoding="utf-8")
     if final_output and output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
         file_map = {
-            "InteractionElements.json": final_output.interaction_elements.model_dump(),
-            "VisualizationElements.json": final_output.visualization_elements.model_dump(),
-            "VisualizationArrays.json": final_output.visualization_arrays.model_dump(),
-            "States.json": final_output.states.model_dump(),
-            "Transitions.json": final_output.transitions.model_dump(),
+            "InteractionElements.json": final_output.interaction_elements,
+            "VisualizationElements.json": final_output.visualization_elements,
+            "VisualizationArrays.json": final_output.visualization_arrays,
+            "States.json": final_output.states,
+            "Transitions.json": final_output.transitions,
         }
-        for filename, payload in file_map.items():
-            path = output_dir / filename
-            path.write_text(json.dumps(payload, indent=4, ensure_ascii=False), encoding="utf-8")
+        def _write_one(path: Path, model) -> Path:
+            # model_dump_json serializes straight from the model in
+            # pydantic-core, skipping the intermediate model_dump() dict, and
+            # runs in the worker thread so the event loop never blocks.
+            path.write_bytes(model.model_dump_json(indent=2).encode("utf-8"))
+            return path
+
+        written = await asyncio.gather(
+            *(asyncio.to_thread(_write_one, output_dir / filename, model)
+              for filename, model in file_map.items())
+        )
+        for path in written:
             print(f"Wrote {path}")
 
     return final_output
 
 
+def run_vivian_batch(
+    inputs: "list[str]",
+    completion_window: str = "24h",
+    poll_interval_s: float = 30.0,
+) -> "list[FunctionalSpecification | None]":
+    """Generate specifications for many inputs through the OpenAI Batch API.
+
+    Meant for offline/nightly regeneration, not the interactive demo: all
+    five generator prompts for every input are submitted as one batch, which
+    halves token cost and lets the provider schedule them in parallel. Blocks
+    while polling until the batch finishes; returns one specification per
+    input (None where any generator request failed).
+    """
+    from openai import OpenAI
+
+    from model._common import json_schema_for
+    from model.output_type_FuncSpec import FunctionalSpecification
+
+    generator_specs = _generator_specs()
+    lines = []
+    for index, user_input in enumerate(inputs):
+        for _, filename, _, instructions, output_type, _ in generator_specs:
+            lines.append(json.dumps({
+                "custom_id": f"{index}:{filename}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": BASE_MODEL,
+                    "messages": [
+                        {"role": "system", "content": instructions},
+                        {"role": "user", "content": user_input},
+                    ],
+                    "response_format": {
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": output_type.__name__,
+                            "schema": json_schema_for(output_type),
+                        },
+                    },
+                },
+            }))
+
+    client = OpenAI()
+    batch_file = client.files.create(
+        file=("vivian_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=completion_window,
+    )
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval_s)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} finished with status {batch.status}")
+
+    outputs_by_input: "list[dict[str, str]]" = [{} for _ in inputs]
+    for line in client.files.content(batch.output_file_id).content.splitlines():
+        if not line.strip():
+            continue
+        entry = json.loads(line)
+        index_text, filename = entry["custom_id"].split(":", 1)
+        body = (entry.get("response") or {}).get("body") or {}
+        choices = body.get("choices") or []
+        content = choices[0].get("message", {}).get("content") if choices else None
+        if content:
+            outputs_by_input[int(index_text)][filename] = content
+
+    specifications: "list[FunctionalSpecification | None]" = []
+    for per_input in outputs_by_input:
+        if len(per_input) != len(generator_specs):
+            specifications.append(None)
+            continue
+        specifications.append(FunctionalSpecification(**{
+            field: output_type.model_validate_json(per_input[filename])
+            for _, filename, field, _, output_type, _ in generator_specs
+        }))
+    return specifications
+
+
 async def agents_vivian():
     """Demo runner that uses the default USER_INPUT and writes files."""
     _ = await run_vivian(USER_INPUT, OUTPUT_DIR)
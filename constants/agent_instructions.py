@@ -1,13 +1,27 @@
+import functools
 from pathlib import Path
 
 
 DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
 
+_DOC_NAMES = (
+    "InteractionElementsDocuLLMFriendly",
+    "TransitionsDocuLLMFriendly",
+    "StatesDocuLLMFriendly",
+    "VisualizationElementsDocuLLMFriendly",
+)
+
 
+@functools.lru_cache(maxsize=None)
 def _read_doc(doc_name: str) -> str:
     return (DOCS_DIR / doc_name).read_text(encoding="utf-8")
 
 
+# Preload all docs once at import so reloads or repeated imports under a
+# different CWD never hit the disk again.
+_DOC_CACHE: dict[str, str] = {name: _read_doc(name) for name in _DOC_NAMES}
+
+
 MANAGER_INSTRUCTIONS: str = """
         You are the Manager Agent for generating complete Vivian FunctionalSpecification configurations for interactive virtual prototypes.
         Your task is to coordinate the creation, validation, and refinement of the following five JSON files:
@@ -58,10 +72,10 @@ MANAGER_INSTRUCTIONS: str = """
         - Keep names consistent across Visualization/Interaction elements, States, and Transitions.
         """
 
-INTERACTION_ELEMENTS_INSTRUCTIONS = _read_doc("InteractionElementsDocuLLMFriendly")
-TRANSITIONS_INSTRUCTIONS = _read_doc("TransitionsDocuLLMFriendly")
-STATES_INSTRUCTIONS = _read_doc("StatesDocuLLMFriendly")
-VISUALIZATION_ELEMENTS_INSTRUCTIONS = _read_doc("VisualizationElementsDocuLLMFriendly")
+INTERACTION_ELEMENTS_INSTRUCTIONS = _DOC_CACHE["InteractionElementsDocuLLMFriendly"]
+TRANSITIONS_INSTRUCTIONS = _DOC_CACHE["TransitionsDocuLLMFriendly"]
+STATES_INSTRUCTIONS = _DOC_CACHE["StatesDocuLLMFriendly"]
+VISUALIZATION_ELEMENTS_INSTRUCTIONS = _DOC_CACHE["VisualizationElementsDocuLLMFriendly"]
 
 VISUALIZATION_ARRAYS_INSTRUCTIONS: str = (
     'Always return a VisualizationArrays.json object containing only an empty array: {"Elements": []}. '
@@ -0,0 +1,66 @@
+import functools
+import sys
+
+from pydantic import BaseModel, TypeAdapter, field_validator
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+
+@functools.lru_cache(maxsize=None)
+def json_schema_for(cls: type) -> dict:
+    """Memoized JSON Schema for a model or adapter-compatible type.
+
+    Generating a schema walks the whole core schema, which is expensive for
+    the deeply nested output types; callers that hand schemas to the OpenAI
+    SDK should go through this cache instead of calling model_json_schema()
+    per construction.
+    """
+    return TypeAdapter(cls).json_schema()
+
+
+class InternedTypeTag(BaseModel):
+    """Mixin for models discriminated by a ``Type`` literal.
+
+    Interning the validated tag means later comparisons hit the shared
+    singleton string (pointer-equal) instead of hashing a fresh str per
+    instance. Runs in mode="after": pydantic forbids before-validators on
+    discriminator fields, and the tag must stay untouched until dispatch.
+    """
+
+    @field_validator("Type", mode="after", check_fields=False)
+    @classmethod
+    def _intern_type(cls, value):
+        return sys.intern(value) if isinstance(value, str) else value
+
+
+# ----------------------------
+# Shared basic value types
+# ----------------------------
+# Defined once so pydantic-core builds a single validator/serializer per type
+# and every element module reuses it instead of duplicating the schema.
+
+# Vec3 is instantiated 3-4 times per element (axes, planes, min/max
+# positions); a frozen slotted dataclass drops the per-instance __dict__ and
+# fields-set bookkeeping of a full BaseModel while keeping the same
+# {"x": ..., "y": ..., "z": ...} JSON shape.
+@pydantic_dataclass(frozen=True, slots=True)
+class Vec3:
+    x: float
+    y: float
+    z: float
+
+
+class Resolution(BaseModel):
+    x: int
+    y: int
+
+
+class ColorRGBA(BaseModel):
+    r: float
+    g: float
+    b: float
+    a: float
+
+
+class AttributeValue(BaseModel):
+    Attribute: str
+    Value: str
@@ -1,37 +1,19 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import Literal, List, Optional, Union, Annotated
 
-
-# ---- Basic Vector Types ----
-
-class Vec3(BaseModel):
-    x: float
-    y: float
-    z: float
-
-
-class Resolution(BaseModel):
-    x: int
-    y: int
-
-
-# ---- Shared Attribute Value ----
-
-class AttributeValue(BaseModel):
-    Attribute: str
-    Value: str
+from model._common import AttributeValue, InternedTypeTag, Resolution, Vec3
 
 
 # ---- Snap Pose (Movable) ----
 
 class SnapPose(BaseModel):
-    Position: str  # e.g., "(0.1, 3.15, 3.4)"
-    Rotation: Optional[str] = None  # optional euler rotation string
+    Position: Vec3
+    Rotation: Optional[Vec3] = None  # optional euler rotation
 
 
 # ---- Interaction Element Base ----
 
-class InteractionElementBase(BaseModel):
+class InteractionElementBase(InternedTypeTag):
     Name: str  # shared for all elements
     Type: str  # discriminator
 
@@ -46,7 +28,7 @@ class Button(InteractionElementBase):
 
 class ToggleButton(InteractionElementBase):
     Type: Literal["ToggleButton"]
-    InitialAttributeValues: Optional[List[AttributeValue]] = None
+    InitialAttributeValues: List[AttributeValue] = Field(default_factory=list)
 
 
 # ---- Slider ----
@@ -55,7 +37,7 @@ class Slider(InteractionElementBase):
     Type: Literal["Slider"]
     MinPosition: Vec3
     MaxPosition: Vec3
-    InitialAttributeValues: Optional[List[AttributeValue]] = None
+    InitialAttributeValues: List[AttributeValue] = Field(default_factory=list)
     PositionResolution: Optional[int] = None
     TransitionTimeInMs: Optional[int] = None
 
@@ -72,7 +54,7 @@ class Rotatable(InteractionElementBase):
     MinRotation: float
     MaxRotation: float
     RotationAxis: RotationAxis
-    InitialAttributeValues: Optional[List[AttributeValue]] = None
+    InitialAttributeValues: List[AttributeValue] = Field(default_factory=list)
     PositionResolution: Optional[int] = None
     AllowsForInfiniteRotation: Optional[bool] = None
     TransitionTimeInMs: Optional[int] = None
@@ -90,8 +72,8 @@ class TouchArea(InteractionElementBase):
 
 class Movable(InteractionElementBase):
     Type: Literal["Movable"]
-    InitialAttributeValues: Optional[List[AttributeValue]] = None
-    SnapPoses: Optional[List[SnapPose]] = None
+    InitialAttributeValues: List[AttributeValue] = Field(default_factory=list)
+    SnapPoses: List[SnapPose] = Field(default_factory=list)
     TransitionTimeInMs: Optional[int] = None
 
 
@@ -106,3 +88,29 @@ InteractionElement = Annotated[
 
 class InteractionElements(BaseModel):
     Elements: List[InteractionElement]
+
+
+# Reusable adapter for validating single elements outside the container
+# model; built once at import so pydantic-core compiles the union schema
+# exactly once per process.
+InteractionElementAdapter = TypeAdapter(InteractionElement)
+
+# Bulk adapter for hot paths: validating the raw element list directly
+# skips the outer container model's field dispatch.
+InteractionElementListAdapter = TypeAdapter(list[InteractionElement])
+
+
+# Explicit tag -> class map; classify_interaction_element validates a raw
+# dict with one dict lookup instead of walking the union dispatcher.
+INTERACTION_ELEMENT_BY_TAG: dict = {
+    "Button": Button,
+    "ToggleButton": ToggleButton,
+    "Slider": Slider,
+    "Rotatable": Rotatable,
+    "TouchArea": TouchArea,
+    "Movable": Movable,
+}
+
+
+def classify_interaction_element(data: dict) -> InteractionElementBase:
+    return INTERACTION_ELEMENT_BY_TAG[data["Type"]].model_validate(data)
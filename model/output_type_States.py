@@ -1,30 +1,40 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Optional, Union, Literal, Annotated
 
+from model._common import InternedTypeTag
+
 
 # ------------------------------------
 # Condition Types
 # ------------------------------------
 
-class FloatValueVisualization(BaseModel):
+class FloatValueVisualization(InternedTypeTag):
+    model_config = ConfigDict(frozen=True)
+
     Type: Literal["FloatValueVisualization"]
     VisualizationElement: str
     Value: float
 
 
-class ScreenContentVisualization(BaseModel):
+class ScreenContentVisualization(InternedTypeTag):
+    model_config = ConfigDict(frozen=True)
+
     Type: Literal["ScreenContentVisualization"]
     VisualizationElement: str
     FileName: str
 
 
-class ValueOfInteractionElementVisualization(BaseModel):
+class ValueOfInteractionElementVisualization(InternedTypeTag):
+    model_config = ConfigDict(frozen=True)
+
     Type: Literal["ValueOfInteractionElementVisualization"]
     VisualizationElement: str
     InteractionElement: str
 
 
-class InteractionElementCondition(BaseModel):
+class InteractionElementCondition(InternedTypeTag):
+    model_config = ConfigDict(frozen=True)
+
     Type: Literal["InteractionElementCondition"]
     InteractionElement: str
     Attribute: str      # FIXED, VALUE, POSITION
@@ -51,6 +61,8 @@ Condition = Annotated[
 # -------------------------------
 
 class State(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     Name: str
     Conditions: List[Condition]
 
@@ -61,3 +73,25 @@ class State(BaseModel):
 
 class States(BaseModel):
     States: List[State]
+
+
+# Built once at import; validates single conditions without rebuilding the
+# union schema per call.
+ConditionAdapter = TypeAdapter(Condition)
+
+# Bulk adapter for hot paths; bypasses the container model's field dispatch.
+StateListAdapter = TypeAdapter(list[State])
+
+
+# Explicit tag -> class map; classify_condition validates a raw dict with one
+# dict lookup instead of walking the union dispatcher.
+CONDITION_BY_TAG: dict = {
+    "FloatValueVisualization": FloatValueVisualization,
+    "ScreenContentVisualization": ScreenContentVisualization,
+    "ValueOfInteractionElementVisualization": ValueOfInteractionElementVisualization,
+    "InteractionElementCondition": InteractionElementCondition,
+}
+
+
+def classify_condition(data: dict):
+    return CONDITION_BY_TAG[data["Type"]].model_validate(data)
@@ -1,19 +1,25 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Optional, Union, Literal, Annotated
 
+from model._common import InternedTypeTag
+
 
 # ----------------------------
 # Guard Types
 # ----------------------------
 
-class EventParameterGuard(BaseModel):
+class EventParameterGuard(InternedTypeTag):
+    model_config = ConfigDict(frozen=True)
+
     Type: Literal["EventParameterGuard"]
     EventParameter: str
     Operator: str                  # e.g. LARGER, SMALLER, EQUALS
     CompareValue: Union[int, float, str]
 
 
-class InteractionElementAttributeGuard(BaseModel):
+class InteractionElementAttributeGuard(InternedTypeTag):
+    model_config = ConfigDict(frozen=True)
+
     Type: Literal["InteractionElementAttributeGuard"]
     InteractionElement: str        # Name of the element
     Attribute: str                 # VALUE, POSITION, etc.
@@ -35,6 +41,8 @@ Guard = Annotated[
 # ----------------------------
 
 class Transition(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     SourceState: str
     DestinationState: str
 
@@ -43,8 +51,8 @@ class Transition(BaseModel):
     Event: Optional[str] = None               # BUTTON_PRESS, TOUCH_END, etc.
     Timeout: Optional[int] = None             # milliseconds
 
-    # Optional guard list
-    Guards: Optional[List[Guard]] = None
+    # Guard list; empty means unguarded
+    Guards: List[Guard] = Field(default_factory=list)
 
 
 # ----------------------------
@@ -53,3 +61,23 @@ class Transition(BaseModel):
 
 class Transitions(BaseModel):
     Transitions: List[Transition]
+
+
+# Built once at import; validates single guards without rebuilding the
+# union schema per call.
+GuardAdapter = TypeAdapter(Guard)
+
+# Bulk adapter for hot paths; bypasses the container model's field dispatch.
+TransitionListAdapter = TypeAdapter(list[Transition])
+
+
+# Explicit tag -> class map; classify_guard validates a raw dict with one
+# dict lookup instead of walking the union dispatcher.
+GUARD_BY_TAG: dict = {
+    "EventParameterGuard": EventParameterGuard,
+    "InteractionElementAttributeGuard": InteractionElementAttributeGuard,
+}
+
+
+def classify_guard(data: dict):
+    return GUARD_BY_TAG[data["Type"]].model_validate(data)
@@ -1,34 +1,14 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional, Union, Annotated, Literal
 
-
-# ----------------------------
-# Basic shared vector structures
-# ----------------------------
-
-class Vec3(BaseModel):
-    x: float
-    y: float
-    z: float
-
-
-class Resolution(BaseModel):
-    x: int
-    y: int
-
-
-class ColorRGBA(BaseModel):
-    r: float
-    g: float
-    b: float
-    a: float
+from model._common import ColorRGBA, InternedTypeTag, Resolution, Vec3
 
 
 # ----------------------------
 # Base element
 # ----------------------------
 
-class VisualizationElementBase(BaseModel):
+class VisualizationElementBase(InternedTypeTag):
     Name: str
     Type: str
 
@@ -108,3 +88,27 @@ VisualizationElement = Annotated[
 
 class VisualizationElements(BaseModel):
     Elements: List[VisualizationElement]
+
+
+# Built once at import; validates single elements without rebuilding the
+# union schema per call.
+VisualizationElementAdapter = TypeAdapter(VisualizationElement)
+
+# Bulk adapter for hot paths; bypasses the container model's field dispatch.
+VisualizationElementListAdapter = TypeAdapter(list[VisualizationElement])
+
+
+# Explicit tag -> class map; classify_visualization_element validates a raw
+# dict with one dict lookup instead of walking the union dispatcher.
+VISUALIZATION_ELEMENT_BY_TAG: dict = {
+    "Light": Light,
+    "Screen": Screen,
+    "AppearingObject": AppearingObject,
+    "SoundSource": SoundSource,
+    "Animation": Animation,
+    "Particles": Particles,
+}
+
+
+def classify_visualization_element(data: dict) -> VisualizationElementBase:
+    return VISUALIZATION_ELEMENT_BY_TAG[data["Type"]].model_validate(data)
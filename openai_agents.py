@@ -1,9 +1,12 @@
 from agents import Agent, Runner
 
+# Constructed once at import: building an Agent also builds its schemas, so
+# repeated calls should reuse one instance instead of rebuilding it.
+_AGENT = Agent(
+    name="MyAgent",
+    instructions="You are a helpful assistant that writes short stories about AI agents.")
+
 
 def my_agent_fun():
-    agent = Agent(
-        name="MyAgent",
-        instructions="You are a helpful assistant that writes short stories about AI agents.")
-    result = Runner.run_sync(agent, "Write me a short story about how openai agents work and if and if so why they are better than ChatGPT")
+    result = Runner.run_sync(_AGENT, "Write me a short story about how openai agents work and if and if so why they are better than ChatGPT")
     print("Agent Response:", result.final_output)
@@ -1,20 +1,42 @@
+import sys
+import time
+
 from agents import Agent, Runner
 from openai.types.responses import ResponseTextDeltaEvent
 
+# How long buffered deltas may sit before being flushed to the terminal.
+_FLUSH_INTERVAL_S = 0.05
+
+# Constructed once at import so repeated streams reuse the same agent instead
+# of rebuilding it per call.
+_AGENT = Agent(
+    name="agent",
+    instructions="You are a useless storyteller and your stories are always way too short"
+)
+
 
 async def agent_stream():
     """
     Demonstration function that streams events from an agent and prints them.
     This function has side effects only and does not return any value.
     """
-    agent = Agent(
-        name="agent",
-        instructions="You are a useless storyteller and your stories are always way too short"
-    )
-
-
-
-    result = Runner.run_streamed(agent, input="Tell me a story about AI agents.")
+    result = Runner.run_streamed(_AGENT, input="Tell me a story about AI agents.")
+    # print(..., flush=True) per token locks, encodes, and flushes stdout for
+    # every delta; buffer the encoded bytes and flush on a short interval
+    # instead.
+    write = sys.stdout.buffer.write
+    flush = sys.stdout.buffer.flush
+    pending = []
+    last_flush = time.monotonic()
     async for event in result.stream_events():
         if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
-            print(event.data.delta, end="", flush=True)
+            pending.append(event.data.delta.encode("utf-8"))
+            now = time.monotonic()
+            if now - last_flush >= _FLUSH_INTERVAL_S:
+                write(b"".join(pending))
+                flush()
+                pending.clear()
+                last_flush = now
+    if pending:
+        write(b"".join(pending))
+    flush()
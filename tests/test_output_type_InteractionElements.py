@@ -0,0 +1,68 @@
+import pytest
+from pydantic import ValidationError
+
+from model._common import Vec3
+from model.output_type_InteractionElements import (
+    INTERACTION_ELEMENT_BY_TAG,
+    Button,
+    InteractionElementAdapter,
+    InteractionElementListAdapter,
+    InteractionElements,
+    Movable,
+    Slider,
+    classify_interaction_element,
+)
+
+
+def test_movable_snap_poses_round_trip():
+    raw = {
+        "Name": "Lever",
+        "Type": "Movable",
+        "SnapPoses": [
+            {"Position": {"x": 0.0, "y": 1.0, "z": 2.0}},
+            {"Position": {"x": 1.0, "y": 0.0, "z": 0.0},
+             "Rotation": {"x": 0.0, "y": 90.0, "z": 0.0}},
+        ],
+    }
+    element = Movable.model_validate(raw)
+    assert element.SnapPoses[0].Position == Vec3(x=0.0, y=1.0, z=2.0)
+    assert element.SnapPoses[0].Rotation is None
+    assert element.SnapPoses[1].Rotation == Vec3(x=0.0, y=90.0, z=0.0)
+    # Serialized and re-validated output must match the original model.
+    assert Movable.model_validate_json(element.model_dump_json()) == element
+
+
+def test_list_fields_default_to_empty_lists():
+    element = Movable.model_validate({"Name": "Box", "Type": "Movable"})
+    assert element.InitialAttributeValues == []
+    assert element.SnapPoses == []
+
+
+def test_slider_requires_positions():
+    with pytest.raises(ValidationError):
+        Slider.model_validate({"Name": "Dimmer", "Type": "Slider"})
+
+
+def test_adapter_dispatches_on_type_tag():
+    element = InteractionElementAdapter.validate_python(
+        {"Name": "Start", "Type": "Button"}
+    )
+    assert isinstance(element, Button)
+    with pytest.raises(ValidationError):
+        InteractionElementAdapter.validate_python({"Name": "X", "Type": "Knob"})
+
+
+def test_list_adapter_matches_container_model():
+    raw = [{"Name": "Start", "Type": "Button"}, {"Name": "Box", "Type": "Movable"}]
+    bulk = InteractionElementListAdapter.validate_python(raw)
+    container = InteractionElements.model_validate({"Elements": raw})
+    assert bulk == container.Elements
+
+
+def test_classify_interaction_element_covers_all_tags():
+    for tag, cls in INTERACTION_ELEMENT_BY_TAG.items():
+        assert cls.model_fields["Type"].annotation.__args__ == (tag,)
+    element = classify_interaction_element({"Name": "Start", "Type": "Button"})
+    assert isinstance(element, Button)
+    with pytest.raises(KeyError):
+        classify_interaction_element({"Name": "X", "Type": "Knob"})
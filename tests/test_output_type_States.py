@@ -0,0 +1,64 @@
+import pytest
+from pydantic import ValidationError
+
+from model.output_type_States import (
+    CONDITION_BY_TAG,
+    ConditionAdapter,
+    InteractionElementCondition,
+    State,
+    StateListAdapter,
+    States,
+    classify_condition,
+)
+
+
+def test_state_round_trip():
+    raw = {
+        "Name": "On",
+        "Conditions": [
+            {"Type": "FloatValueVisualization", "VisualizationElement": "Lamp", "Value": 1.0},
+            {"Type": "InteractionElementCondition", "InteractionElement": "Switch",
+             "Attribute": "VALUE", "Value": "ON"},
+        ],
+    }
+    state = State.model_validate(raw)
+    assert State.model_validate_json(state.model_dump_json()) == state
+
+
+def test_condition_value_accepts_string_and_float():
+    base = {"Type": "InteractionElementCondition", "InteractionElement": "Dial",
+            "Attribute": "VALUE"}
+    assert ConditionAdapter.validate_python({**base, "Value": 0.5}).Value == 0.5
+    assert ConditionAdapter.validate_python({**base, "Value": "(0, 1, 0)"}).Value == "(0, 1, 0)"
+
+
+def test_conditions_ignore_extra_fields():
+    # Stray keys in LLM output are dropped, matching the pre-frozen models.
+    condition = InteractionElementCondition.model_validate({
+        "Type": "InteractionElementCondition", "InteractionElement": "Switch",
+        "Attribute": "VALUE", "Value": "ON", "Unknown": True,
+    })
+    assert not hasattr(condition, "Unknown")
+
+
+def test_states_are_frozen():
+    state = State.model_validate({"Name": "Off", "Conditions": []})
+    with pytest.raises(ValidationError):
+        state.Name = "On"
+
+
+def test_list_adapter_matches_container_model():
+    raw = [{"Name": "Off", "Conditions": []}, {"Name": "On", "Conditions": []}]
+    assert StateListAdapter.validate_python(raw) == States.model_validate({"States": raw}).States
+
+
+def test_classify_condition_covers_all_tags():
+    for tag, cls in CONDITION_BY_TAG.items():
+        assert cls.model_fields["Type"].annotation.__args__ == (tag,)
+    condition = classify_condition({
+        "Type": "ScreenContentVisualization", "VisualizationElement": "Display",
+        "FileName": "menu.png",
+    })
+    assert condition.FileName == "menu.png"
+    with pytest.raises(KeyError):
+        classify_condition({"Type": "NoSuchCondition"})
@@ -0,0 +1,73 @@
+import pytest
+from pydantic import ValidationError
+
+from model.output_type_Transitions import (
+    GUARD_BY_TAG,
+    EventParameterGuard,
+    GuardAdapter,
+    Transition,
+    TransitionListAdapter,
+    Transitions,
+    classify_guard,
+)
+
+
+def test_transition_round_trip():
+    raw = {
+        "SourceState": "Off",
+        "DestinationState": "On",
+        "InteractionElement": "StartButton",
+        "Event": "BUTTON_PRESS",
+        "Guards": [
+            {"Type": "EventParameterGuard", "EventParameter": "FORCE",
+             "Operator": "LARGER", "CompareValue": 0.5},
+        ],
+    }
+    transition = Transition.model_validate(raw)
+    assert Transition.model_validate_json(transition.model_dump_json()) == transition
+
+
+def test_guards_default_to_empty_list():
+    transition = Transition.model_validate({"SourceState": "Off", "DestinationState": "On"})
+    assert transition.Guards == []
+
+
+def test_guards_ignore_extra_fields():
+    # Stray keys in LLM output are dropped, matching the pre-frozen models.
+    guard = EventParameterGuard.model_validate({
+        "Type": "EventParameterGuard", "EventParameter": "FORCE",
+        "Operator": "LARGER", "CompareValue": 1, "Unknown": True,
+    })
+    assert not hasattr(guard, "Unknown")
+
+
+def test_adapter_dispatches_on_type_tag():
+    guard = GuardAdapter.validate_python({
+        "Type": "InteractionElementAttributeGuard", "InteractionElement": "Dial",
+        "Attribute": "VALUE", "Operator": "EQUALS", "CompareValue": "ON",
+    })
+    assert guard.CompareValue == "ON"
+    with pytest.raises(ValidationError):
+        GuardAdapter.validate_python({"Type": "NoSuchGuard"})
+
+
+def test_list_adapter_matches_container_model():
+    raw = [
+        {"SourceState": "Off", "DestinationState": "On", "Event": "BUTTON_PRESS"},
+        {"SourceState": "On", "DestinationState": "Off", "Timeout": 5000},
+    ]
+    bulk = TransitionListAdapter.validate_python(raw)
+    container = Transitions.model_validate({"Transitions": raw})
+    assert bulk == container.Transitions
+
+
+def test_classify_guard_covers_all_tags():
+    for tag, cls in GUARD_BY_TAG.items():
+        assert cls.model_fields["Type"].annotation.__args__ == (tag,)
+    guard = classify_guard({
+        "Type": "EventParameterGuard", "EventParameter": "FORCE",
+        "Operator": "SMALLER", "CompareValue": 1,
+    })
+    assert isinstance(guard, EventParameterGuard)
+    with pytest.raises(KeyError):
+        classify_guard({"Type": "NoSuchGuard"})
@@ -0,0 +1,58 @@
+import pytest
+from pydantic import ValidationError
+
+from model._common import Vec3
+from model.output_type_VisualizationElements import (
+    VISUALIZATION_ELEMENT_BY_TAG,
+    AppearingObject,
+    Light,
+    Screen,
+    VisualizationElementAdapter,
+    VisualizationElements,
+    classify_visualization_element,
+)
+
+
+def test_screen_plane_round_trip():
+    raw = {
+        "Name": "Display",
+        "Type": "Screen",
+        "Plane": {"x": 0.0, "y": 0.0, "z": 1.0},
+        "Resolution": {"x": 800, "y": 600},
+    }
+    element = Screen.model_validate(raw)
+    assert element.Plane == Vec3(x=0.0, y=0.0, z=1.0)
+    assert Screen.model_validate_json(element.model_dump_json()) == element
+
+
+def test_appearing_object_value_defaults_to_none():
+    element = AppearingObject.model_validate({"Name": "Lid", "Type": "AppearingObject"})
+    assert element.Value is None
+
+
+def test_light_requires_emission_color():
+    with pytest.raises(ValidationError):
+        Light.model_validate({"Name": "Lamp", "Type": "Light"})
+
+
+def test_adapter_dispatches_on_type_tag():
+    raw = {
+        "Name": "Lamp",
+        "Type": "Light",
+        "EmissionColor": {"r": 1.0, "g": 0.5, "b": 0.0, "a": 1.0},
+    }
+    element = VisualizationElementAdapter.validate_python(raw)
+    assert isinstance(element, Light)
+    container = VisualizationElements.model_validate({"Elements": [raw]})
+    assert container.Elements == [element]
+    with pytest.raises(ValidationError):
+        VisualizationElementAdapter.validate_python({"Name": "X", "Type": "Hologram"})
+
+
+def test_classify_visualization_element_covers_all_tags():
+    for tag, cls in VISUALIZATION_ELEMENT_BY_TAG.items():
+        assert cls.model_fields["Type"].annotation.__args__ == (tag,)
+    element = classify_visualization_element({"Name": "Beep", "Type": "SoundSource"})
+    assert element.Type == "SoundSource"
+    with pytest.raises(KeyError):
+        classify_visualization_element({"Name": "X", "Type": "Hologram"})
@@ -2,36 +2,69 @@
 """Unity entrypoint that reuses the existing Vivian agent pipeline."""
 
 import asyncio
+import atexit
+import concurrent.futures
+import functools
 import os
 import sys
 from pathlib import Path
 from typing import Dict, Tuple
 
+try:
+    import uvloop
+except ImportError:  # not installed, or Windows; the stdlib loop works fine
+    uvloop = None
+
 DEFAULT_OUTPUT_ROOT = Path("generated_specs")
 
 
 def _prepare_console() -> None:
-    try:
-        sys.stdout.reconfigure(errors="replace")
-        sys.stderr.reconfigure(errors="replace")
-    except Exception:
-        pass
+    # Capability probe instead of try/except: streams that cannot be
+    # reconfigured (e.g. Unity's captured pipes) cost two attribute loads
+    # rather than an exception unwind, and already-configured streams are
+    # skipped outright.
+    for stream in (sys.stdout, sys.stderr):
+        if hasattr(stream, "reconfigure") and getattr(stream, "errors", None) != "replace":
+            stream.reconfigure(errors="replace")
 
 
-def _ensure_sys_path() -> None:
-    """Add project root and local venv site-packages so Unity can import dependencies."""
-    here = Path(__file__).resolve().parent
+_HERE = Path(__file__).resolve().parent
+
+
+@functools.lru_cache(maxsize=1)
+def _sys_path_additions() -> Tuple[str, ...]:
+    """Existing sys.path candidates, probed once per process.
+
+    Each .exists() is a stat syscall; caching the surviving candidates means
+    repeated main() invocations skip the filesystem probing entirely.
+    """
     candidates = [
-        here,
-        here.parent,
+        _HERE,
+        _HERE.parent,
         Path(os.getenv("VIVIAN_VENV", "")).expanduser() / "Lib" / "site-packages",
-        here / ".venv" / "Lib" / "site-packages",
-        here / "venv" / "Lib" / "site-packages",
-        here / "env" / "Lib" / "site-packages",
+        _HERE / ".venv" / "Lib" / "site-packages",
+        _HERE / "venv" / "Lib" / "site-packages",
+        _HERE / "env" / "Lib" / "site-packages",
     ]
-    for path in candidates:
-        if path and path.exists():
-            sys.path.insert(0, str(path))
+    # os.path.isdir is one stat without the extra Path object construction.
+    return tuple(str(path) for path in candidates if path and os.path.isdir(str(path)))
+
+
+_SYS_PATH_PATCHED = False
+
+
+def _ensure_sys_path() -> None:
+    """Add project root and local venv site-packages so Unity can import dependencies."""
+    global _SYS_PATH_PATCHED
+    if _SYS_PATH_PATCHED:
+        return
+    # Skipping duplicates keeps sys.path short, so every later import walks
+    # fewer entries.
+    existing = frozenset(sys.path)
+    for path in _sys_path_additions():
+        if path not in existing:
+            sys.path.insert(0, path)
+    _SYS_PATH_PATCHED = True
 
 
 def _parse_argv(argv: list[str]) -> Tuple[str, str, Dict[str, str]]:
@@ -39,48 +72,125 @@ def _parse_argv(argv: list[str]) -> Tuple[str, str, Dict[str, str]]:
     if not argv:
         return "GeneratedGroup", "", {}
 
-    if len(argv) >= 3 and (len(argv) - 2) % 2 == 0:
-        group = argv[0]
-        description = argv[1]
-        pairs = argv[2:]
-    else:
-        group = "GeneratedGroup"
-        description = argv[0]
-        pairs = argv[1:]
+    # One length read drives the whole layout decision: a leading group name
+    # is present exactly when an even number of pair tokens follows it.
+    n = len(argv)
+    has_group = n >= 3 and (n - 2) % 2 == 0
+    start = 1 if has_group else 0
+    group = argv[0] if has_group else "GeneratedGroup"
+    description = argv[start]
+    pairs = argv[start + 1:]
 
     if len(pairs) % 2 != 0:
         pairs = pairs[:-1]
 
-    objects = {pairs[i]: pairs[i + 1] for i in range(0, len(pairs), 2)}
+    # dict(zip(it, it)) walks the pairs once in C instead of double-indexing
+    # the list per pair in Python bytecode.
+    it = iter(pairs)
+    objects = dict(zip(it, it))
     return group, description, objects
 
-def _output_dirs(group: str) -> Tuple[Path, Path]:
-    env_root = os.getenv("VIVIAN_OUTPUT_ROOT")
+@functools.lru_cache(maxsize=1)
+def _resolve_output_root(env_root: "str | None", cwd: str) -> Path:
+    """Resolve the output root once per (env var, cwd) combination.
+
+    Keyed on its inputs so repeated runs skip the directory probe while a
+    changed environment or working directory still recomputes.
+    """
     if env_root:
-        root = Path(env_root)
-    else:
-        unity_root = Path.cwd() / "Packages" / "vivian-example-prototypes" / "Resources"
-        root = unity_root if unity_root.exists() else DEFAULT_OUTPUT_ROOT
+        return Path(env_root)
+    unity_root = os.path.join(cwd, "Packages", "vivian-example-prototypes", "Resources")
+    return Path(unity_root) if os.path.isdir(unity_root) else DEFAULT_OUTPUT_ROOT
 
-    group_dir = root / (group or "GeneratedGroup")
-    fs_dir = group_dir / "FunctionalSpecification"
-    fs_dir.mkdir(parents=True, exist_ok=True)
-    return group_dir, fs_dir
 
+# Directories already created this process; repeat runs skip the mkdir
+# syscalls (mkdir walks every path component even with exist_ok=True).
+_CREATED_DIRS: set = set()
 
-def main() -> None:
-    _prepare_console()
-    _ensure_sys_path()
 
+def _output_dirs(group: str) -> Tuple[Path, Path]:
+    root = _resolve_output_root(os.getenv("VIVIAN_OUTPUT_ROOT"), os.getcwd())
+
+    # os.path.join is a single C call; the pathlib __truediv__ chain builds
+    # an intermediate PurePath per component. Wrap in Path only at the return
+    # boundary.
+    # The group name is used verbatim: Unity looks the spec directory up
+    # under the exact name it passed in, so no sanitization here.
+    group_str = os.path.join(str(root), group or "GeneratedGroup")
+    fs_key = os.path.join(group_str, "FunctionalSpecification")
+    if fs_key not in _CREATED_DIRS:
+        os.makedirs(fs_key, exist_ok=True)
+        _CREATED_DIRS.add(fs_key)
+    return Path(group_str), Path(fs_key)
+
+
+_LOOP = None
+
+
+def _run_coro(coro):
+    """Run a coroutine on a process-wide cached event loop.
+
+    asyncio.run builds and tears down a loop, selector, and default executor
+    per call, and drops the HTTP client's warmed SSL/session state with them.
+    Unity fires many generations per editor session, so keep one loop alive
+    and close it at interpreter exit.
+    """
+    # _get_running_loop returns None instead of raising when no loop is
+    # active, so the reentrancy check costs an attribute call, not an
+    # exception. If a loop is already running in *this* thread (Unity
+    # embedding scenario), blocking on it would deadlock; run the coroutine
+    # to completion on a worker thread with its own loop instead.
+    running = asyncio._get_running_loop()
+    if running is not None:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        atexit.register(_LOOP.close)
+    return _LOOP.run_until_complete(coro)
+
+
+def _load_agents() -> None:
+    """Resolve agents_vivian symbols once and cache them in module globals.
+
+    Imported late so _ensure_sys_path has already patched sys.path. After the
+    first resolution the names live in this module's __dict__, so repeated
+    main() calls skip the import machinery and the try/except entirely.
+    """
+    if "run_vivian" in globals():
+        return
     try:
-        from agents_vivian import build_vivian_prompt, run_vivian  # imported late so sys.path is patched
-    except ModuleNotFoundError as exc:
+        from agents_vivian import build_vivian_prompt, run_vivian
+    except ModuleNotFoundError:
         print(
             "Could not import project modules (missing 'agents' dependency). "
             "Ensure Unity uses this repo's virtualenv or set VIVIAN_VENV to the venv path.",
             file=sys.stderr,
         )
-        raise exc
+        raise
+    globals()["build_vivian_prompt"] = build_vivian_prompt
+    globals()["run_vivian"] = run_vivian
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_prompt(description: str, object_items: tuple) -> str:
+    """Memoized build_vivian_prompt; dicts are unhashable, so callers pass
+    the sorted items tuple. Unity's edit-and-regenerate flow repeats the same
+    scene often within a session.
+    """
+    return build_vivian_prompt(description, dict(object_items))
+
+
+def main() -> None:
+    _prepare_console()
+    _ensure_sys_path()
+    if uvloop is not None:
+        # libuv-backed loop: cheaper scheduling for the agent-call heavy run.
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    _load_agents()
 
     if not os.getenv("OPENAI_API_KEY"):
         print("Please set the OPENAI_API_KEY environment variable before running.")
@@ -91,18 +201,22 @@ def main() -> None:
         print("No description provided. Please pass at least a short scene description.")
         sys.exit(1)
 
-    print("Unity -> Vivian Agent Connector")
-    print("______________________________")
-    print("Group:", group or "(empty)")
-    print("Description:", description or "(empty)")
-    for name, element in object_interactions.items():
-        print(f"{name}: {element}")
+    # One write for the whole banner: each print is a separate syscall on
+    # Unity's captured pipe, which adds up for scenes with many objects.
+    banner = [
+        "Unity -> Vivian Agent Connector",
+        "______________________________",
+        f"Group: {group or '(empty)'}",
+        f"Description: {description or '(empty)'}",
+    ]
+    banner.extend(f"{name}: {element}" for name, element in object_interactions.items())
+    sys.stdout.write("\n".join(banner) + "\n")
 
-    user_prompt = build_vivian_prompt(description, object_interactions)
+    user_prompt = _cached_prompt(description, tuple(sorted(object_interactions.items())))
     group_dir, fs_dir = _output_dirs(group)
 
     try:
-        spec = asyncio.run(run_vivian(user_prompt, fs_dir))
+        spec = _run_coro(run_vivian(user_prompt, fs_dir))
     except Exception as exc:  # pragma: no cover - defensive logging
         print(f"Failed to run Vivian pipeline: {exc}", file=sys.stderr)
         sys.exit(1)